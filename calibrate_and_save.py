@@ -3,14 +3,14 @@
 Calibrate gripper and save to config file for driver to load
 """
 import json
-import os
 import time
 from libezgripper import create_connection, create_gripper
+from libezgripper.device_config import DEVICE_CONFIG_FILE, update_device_config
 import serial.tools.list_ports
 
 # Configuration
 device = '/dev/ttyUSB0'
-config_file = '/tmp/ezgripper_device_config.json'
+config_file = DEVICE_CONFIG_FILE
 
 print("=" * 60)
 print("EZGRIPPER CALIBRATION WITH CONFIG SAVE")
@@ -53,22 +53,11 @@ print(f"   Calibration offset (for config): {calibration_offset}")
 # Save to config file
 print(f"\n4. Saving calibration to {config_file}...")
 try:
-    # Load existing config
-    config = {}
-    if os.path.exists(config_file):
-        with open(config_file, 'r') as f:
-            config = json.load(f)
-    
-    # Initialize calibration dict if needed
-    if 'calibration' not in config:
-        config['calibration'] = {}
-    
     # Save calibration by serial number (positive value)
-    config['calibration'][serial_number] = calibration_offset
+    def _set_calibration(config):
+        config.setdefault('calibration', {})[serial_number] = calibration_offset
     
-    # Write back
-    with open(config_file, 'w') as f:
-        json.dump(config, f, indent=2)
+    config = update_device_config(_set_calibration, config_file)
     
     print(f"   ✅ Saved calibration for serial {serial_number}")
     print(f"\nConfig file contents:")
@@ -62,16 +62,15 @@ class ErrorRecoveryHandler:
     def read_error_status(self, servo) -> ErrorStatus:
         """Read hardware error status from servo"""
         try:
-            # Read Hardware Error Status register (Address 70)
-            error_data = servo.read_address(self.HARDWARE_ERROR_STATUS, 2)
-            if error_data and len(error_data) >= 2:
-                error_bits = error_data[0] | (error_data[1] << 8)
-            else:
-                error_bits = 0
-                
-            # Read Torque Enable to check if servo is in shutdown
-            torque_data = servo.read_address(self.TORQUE_ENABLE, 1)
-            torque_enabled = torque_data[0] == 1 if torque_data else False
+            # Read Torque Enable (Address 64) through Hardware Error Status
+            # (Address 70-71) in a single transaction
+            start = self.TORQUE_ENABLE
+            block = servo.read_block(start, self.HARDWARE_ERROR_STATUS + 2 - start)
+            error_offset = self.HARDWARE_ERROR_STATUS - start
+            error_bits = int.from_bytes(block[error_offset:error_offset + 2], 'little')
+            
+            # Torque Enable tells us if the servo is in shutdown
+            torque_enabled = block[0] == 1
             
             # Create error status
             status = ErrorStatus(
@@ -21,7 +21,9 @@ from urllib.parse import urlparse, parse_qs
 import socket
 
 # CycloneDDS will auto-detect library location
-# os.environ['CYCLONEDDS_HOME'] = '/usr/lib/x86_64-linux-gnu'
+# If an override is ever needed, use setdefault so a deployment's own
+# CYCLONEDDS_HOME is not clobbered:
+# os.environ.setdefault('CYCLONEDDS_HOME', '/usr/lib/x86_64-linux-gnu')
 
 from unitree_sdk2py.core.channel import ChannelPublisher, ChannelSubscriber, ChannelFactoryInitialize
 
@@ -94,6 +96,7 @@ from libezgripper import create_connection, create_gripper
 from libezgripper.grasp_manager import GraspManager
 from libezgripper.gripper_telemetry import GripperTelemetry
 from libezgripper.health_monitor import HealthMonitor
+from libezgripper.device_config import DEVICE_CONFIG_FILE, update_device_config
 import serial.tools.list_ports
 
 # EZGripper DDS messages for advanced interface
@@ -113,9 +116,11 @@ from error_recovery_enhancement import ErrorRecoveryHandler, ErrorRecoveryComman
 @dataclass
 class GripperCommand:
     """Queued gripper command"""
+    __slots__ = ('position_pct', 'effort_pct', 'timestamp', 'q_radians', 'tau')
+
     position_pct: float
     effort_pct: float
-    timestamp: float
+    timestamp: float        # time.monotonic() at reception - for age checks only
     q_radians: float
     tau: float
 
@@ -172,7 +177,7 @@ def verify_device_mapping(config):
 
 def get_device_config():
     """Load device configuration from file or auto-discover"""
-    config_file = '/tmp/ezgripper_device_config.json'
+    config_file = DEVICE_CONFIG_FILE
     
     # Try to load existing config
     if os.path.exists(config_file):
@@ -202,9 +207,12 @@ def get_device_config():
         config = verify_device_mapping(config)
         
         # Save config
+        def _replace(existing):
+            existing.clear()
+            existing.update(config)
+        
         try:
-            with open(config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+            update_device_config(_replace, config_file)
             logging.info(f"Saved device config: {config_file}")
         except Exception as e:
             logging.warning(f"Failed to save config: {e}")
@@ -233,6 +241,26 @@ def get_device_config():
 class CorrectedEZGripperDriver:
     """Corrected EZGripper DDS Driver with Command Queue"""
 
+    # Dex1 joint range: 0.0 rad = closed, 5.4 rad = open
+    DEX1_OPEN_RADIANS = 5.4
+
+    # GraspManager state name -> MotorState_.mode shown by the GUI (publish_state)
+    GUI_MODE_BY_STATE = {
+        'idle': 0,
+        'moving': 1,
+        'contact': 2,
+        'grasping': 3
+    }
+
+    # GraspManager state name -> EZGripper interface enum (publish_ezgripper_state)
+    GRASP_STATE_BY_NAME = {
+        'idle': GraspState.IDLE,
+        'moving': GraspState.MOVING,
+        'contact': GraspState.CONTACT,
+        'grasping': GraspState.GRASPING,
+        'error': GraspState.ERROR
+    }
+
     def __init__(self, side: str, device: str = "/dev/ttyUSB0", domain: int = 0,
                  calibration_file: str = None, servo_id: int = 1,
                  connection=None, dds_initialized: bool = False):
@@ -278,14 +306,14 @@ class CorrectedEZGripperDriver:
         self.hardware_healthy = True          # Hardware communication status
         self.comm_error_count = 0            # Consecutive communication errors
         self.max_comm_errors = 5             # Stop after N consecutive errors
-        self.last_successful_comm = time.time()
+        self.last_successful_comm = time.monotonic()
         self.servo_error_count = 0           # Servo hardware errors
         self.critical_servo_errors = 0       # Critical servo errors
         
         # Monitoring for verification
         self.state_publish_count = 0
         self.state_publish_error_count = 0
-        self.last_monitor_time = time.time()
+        self.last_monitor_time = time.monotonic()
         self.monitor_interval = 5.0  # Report every 5 seconds
         
         # Latest command (thread-safe)
@@ -300,7 +328,7 @@ class CorrectedEZGripperDriver:
         self.state_lock = threading.Lock()  # Protects shared state variables
         self.control_thread = None
         self.state_thread = None
-        self.command_thread = None  # Separate thread for DDS command reception
+        self.dds_command_count = 0  # Dex1 commands received by dex1_command_callback
         
         # Grasp manager - state-based adaptive grasping
         self.grasp_manager = None  # Initialized after hardware
@@ -323,6 +351,16 @@ class CorrectedEZGripperDriver:
         self.grasp_manager = GraspManager(self.gripper.config)
         # GraspManager prints its own initialization message
         
+        # Hardware current limit for GraspManager percentage conversion.
+        # Config is fixed for the driver's lifetime, so resolve it once here
+        # instead of walking the config dict on every 30 Hz cycle.
+        self.hardware_current_limit = self.gripper.config.current_limit
+        
+        # Dex1 <-> EZGripper position conversion factors (see dex1_to_ezgripper)
+        self.max_open_percent = self.gripper.config.max_open_percent
+        self._q_to_pct = self.max_open_percent / self.DEX1_OPEN_RADIANS
+        self._pct_to_q = self.DEX1_OPEN_RADIANS / self.max_open_percent
+        
         # Initialize health monitor for telemetry
         if self.gripper.servos:
             self.health_monitor = HealthMonitor(self.gripper.servos[0], self.gripper.config)
@@ -456,15 +494,9 @@ class CorrectedEZGripperDriver:
     
     def _update_device_config(self):
         """Update device config with current device and serial number mapping"""
-        config_file = '/tmp/ezgripper_device_config.json'
+        config_file = DEVICE_CONFIG_FILE
         
-        try:
-            # Load existing config
-            config = {}
-            if os.path.exists(config_file):
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
-            
+        def _set_mapping(config):
             # Update device and serial mapping for this side
             config[self.side] = self.device
             config[f"{self.side}_serial"] = self.serial_number
@@ -472,10 +504,9 @@ class CorrectedEZGripperDriver:
             # Initialize calibration dict if needed
             if 'calibration' not in config:
                 config['calibration'] = {}
-            
-            # Write back
-            with open(config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+        
+        try:
+            update_device_config(_set_mapping, config_file)
             
             self.logger.info(f"Updated device config: {self.side} -> {self.device} (serial: {self.serial_number})")
             
@@ -484,7 +515,7 @@ class CorrectedEZGripperDriver:
     
     def _load_calibration(self):
         """Load calibration offset from device config using serial number from hardware"""
-        config_file = '/tmp/ezgripper_device_config.json'
+        config_file = DEVICE_CONFIG_FILE
         
         try:
             if os.path.exists(config_file):
@@ -508,27 +539,20 @@ class CorrectedEZGripperDriver:
     
     def save_calibration(self, offset: float):
         """Save calibration offset to device config using serial number from hardware"""
-        config_file = '/tmp/ezgripper_device_config.json'
+        config_file = DEVICE_CONFIG_FILE
         
-        try:
-            # Load existing config
-            config = {}
-            if os.path.exists(config_file):
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
+        def _set_calibration(config):
+            # Initialize calibration dict if needed
+            if 'calibration' not in config:
+                config['calibration'] = {}
             
+            # Save offset for this serial number
+            config['calibration'][self.serial_number] = offset
+        
+        try:
             # Use serial number read from hardware
             if self.serial_number and self.serial_number != 'unknown':
-                # Initialize calibration dict if needed
-                if 'calibration' not in config:
-                    config['calibration'] = {}
-                
-                # Save offset for this serial number
-                config['calibration'][self.serial_number] = offset
-                
-                # Write back
-                with open(config_file, 'w') as f:
-                    json.dump(config, f, indent=2)
+                update_device_config(_set_calibration, config_file)
                 
                 self.logger.info(f"Saved calibration offset for {self.serial_number}: {offset}")
             else:
@@ -550,12 +574,41 @@ class CorrectedEZGripperDriver:
         state_topic_name = f"rt/dex1/{self.side}/state"
         
         # Create publisher and subscriber - matches xr_teleoperate exactly
+        # (the subscriber's listener is attached in start(), once the
+        # conversion constants and GraspManager exist)
         self.cmd_subscriber = ChannelSubscriber(cmd_topic_name, MotorCmds_)
-        self.cmd_subscriber.Init()
         
         self.state_publisher = ChannelPublisher(state_topic_name, MotorStates_)
         self.state_publisher.Init()
         
+        # State message reused by publish_state() at 200 Hz. Write() serializes
+        # the sample before returning, so updating it in place between writes
+        # is safe and avoids building two IDL objects per publish.
+        self._state_msg = MotorState_(
+            mode=0, q=0.0, dq=0.0, ddq=0.0, tau_est=0.0,
+            q_raw=0.0, dq_raw=0.0, ddq_raw=0.0,
+            temperature=0, lost=0, reserve=[0, 0]
+        )
+        self._states_msg = MotorStates_()
+        self._states_msg.states = [self._state_msg]
+        
+        # Fixed error-state message published while hardware is unhealthy
+        error_state = MotorState_(
+            mode=255,                    # Error mode
+            q=0.0,                       # Safe position
+            dq=0.0,                      # No velocity
+            ddq=0.0,                     # No acceleration
+            tau_est=0.0,                 # No torque
+            q_raw=0.0,                   # Raw position (float32)
+            dq_raw=0.0,                  # Raw velocity (float32)
+            ddq_raw=0.0,                 # Raw acceleration (float32)
+            temperature=0,               # Error temperature (uint8)
+            lost=0xFFFFFFFF,             # Error - max lost packets (uint32)
+            reserve=[0xFFFFFFFF, 0xFFFFFFFF]  # Error flags (array[uint32, 2])
+        )
+        self._error_states_msg = MotorStates_()
+        self._error_states_msg.states = [error_state]
+        
         # Setup telemetry publisher - always enabled for monitoring
         telemetry_config = self.gripper.config._config.get('telemetry', {})
         topic_prefix = telemetry_config.get('topic_prefix', 'rt/gripper')
@@ -617,10 +670,7 @@ class CorrectedEZGripperDriver:
             zero_pos = self.gripper.zero_positions[0]
             self.save_calibration(zero_pos)
 
-            # Calibration already moved to 50% position, wait for it to arrive
-            import time
-            time.sleep(1.0)  # Give gripper time to reach 50%
-
+            # Calibration already waited for the 50% position to settle
             sensor_data = self.gripper.bulk_read_sensor_data(0)
             actual = sensor_data.get('position', 0.0)
             error = abs(actual - 50.0)
@@ -651,15 +701,14 @@ class CorrectedEZGripperDriver:
         - 0.0 rad -> 0% (closed)
         - 5.4 rad -> max_open_percent (open)
         """
-        q_clamped = max(0.0, min(5.4, q_radians))
-        # Direct mapping: 0 rad -> 0%, 5.4 rad -> 100%
-        position_100 = (q_clamped / 5.4) * 100.0
-        
-        # Scale to max_open_percent: 100% input → max_open_percent output
-        max_open = self.gripper.config.max_open_percent
-        scaled_position = (position_100 / 100.0) * max_open
-        
-        return max(0.0, min(max_open, scaled_position))
+        # Clamp to [0, 5.4] rad, then map straight onto [0, max_open_percent]
+        # with the factor precomputed in __init__
+        # (NaN falls into the open branch, as it did with min()/max())
+        if not q_radians < self.DEX1_OPEN_RADIANS:
+            return float(self.max_open_percent)
+        if q_radians <= 0.0:
+            return 0.0
+        return q_radians * self._q_to_pct
     
     def ezgripper_to_dex1(self, position_pct: float) -> float:
         """
@@ -672,59 +721,55 @@ class CorrectedEZGripperDriver:
         - 0% (closed) -> 0.0 rad
         - max_open_percent (open) -> 5.4 rad
         """
-        max_open = self.gripper.config.max_open_percent
-        
-        # Unscale from max_open_percent to 0-100%
-        position_100 = (position_pct / max_open) * 100.0
-        pct_clamped = max(0.0, min(100.0, position_100))
-        
-        # Direct mapping: 0% -> 0 rad, 100% -> 5.4 rad
-        return (pct_clamped / 100.0) * 5.4
+        # Clamp to [0, max_open_percent], then map straight onto [0, 5.4] rad
+        # with the factor precomputed in __init__
+        if not position_pct < self.max_open_percent:
+            return self.DEX1_OPEN_RADIANS
+        if position_pct <= 0.0:
+            return 0.0
+        return position_pct * self._pct_to_q
     
-    def command_reception_loop(self):
-        """Dedicated thread for DDS command reception (blocking Read() is OK here)"""
-        self.logger.info("Starting command reception thread...")
-        self.logger.info(f"Listening on topic: rt/dex1/{self.side}/cmd")
+    def dex1_command_callback(self, cmd_msg):
+        """Handle a Dex1 command sample (called on the DDS listener thread)"""
+        if not self.running:
+            return
         
-        cmd_count = 0
-        while self.running:
-            try:
-                # ChannelSubscriber.Read() blocks until message arrives - that's OK in this thread
-                cmd_msg = self.cmd_subscriber.Read()
-                
-                if cmd_msg and hasattr(cmd_msg, 'cmds') and cmd_msg.cmds and len(cmd_msg.cmds) > 0:
-                    motor_cmd = cmd_msg.cmds[0]
-                    cmd_count += 1
-                    
-                    # Dex1 interface is POSITION-ONLY - no error recovery, no force control
-                    # Convert Dex1 command to gripper parameters
-                    target_position = self.dex1_to_ezgripper(motor_cmd.q)
-                    
-                    # Log every command for debugging (will reduce later)
-                    if cmd_count % 10 == 1:  # Log every 10th command
-                        self.logger.info(f"📥 DDS CMD #{cmd_count}: q={motor_cmd.q:.3f} rad → {target_position:.1f}%")
-                    
-                    # Store latest command (effort will be managed by GraspManager)
-                    self.latest_command = GripperCommand(
-                        position_pct=target_position,
-                        effort_pct=0.0,  # Effort managed by GraspManager
-                        timestamp=time.time(),
-                        q_radians=motor_cmd.q,
-                        tau=motor_cmd.tau
-                    )
-                else:
-                    # Log when we get a message but it's empty/invalid
-                    if cmd_count == 0:  # Only log if we haven't received any valid commands yet
-                        self.logger.warning(f"Received invalid/empty command message: {cmd_msg}")
-            
-            except Exception as e:
-                if self.running:  # Only log if not shutting down
-                    self.logger.error(f"Command reception error: {e}")
-                    import traceback
-                    self.logger.error(traceback.format_exc())
-                    time.sleep(0.1)  # Brief pause on error
+        # EAFP: a valid sample is the common case, so index straight in
+        # and treat a missing/empty cmds field as the exception
+        try:
+            motor_cmd = cmd_msg.cmds[0]
+        except (AttributeError, IndexError, TypeError):
+            # Log when we get a message but it's empty/invalid
+            if self.dds_command_count == 0:  # Only log if we haven't received any valid commands yet
+                self.logger.warning(f"Received invalid/empty command message: {cmd_msg}")
+            return
         
-        self.logger.info(f"Command reception thread stopped (received {cmd_count} commands total)")
+        try:
+            self.dds_command_count += 1
+            cmd_count = self.dds_command_count
+            
+            # Dex1 interface is POSITION-ONLY - no error recovery, no force control
+            # Convert Dex1 command to gripper parameters
+            # Read the sample fields once; each access goes through the IDL struct
+            q = motor_cmd.q
+            target_position = self.dex1_to_ezgripper(q)
+            
+            # Log every command for debugging (will reduce later)
+            if cmd_count % 10 == 1:  # Log every 10th command
+                self.logger.info(f"📥 DDS CMD #{cmd_count}: q={q:.3f} rad → {target_position:.1f}%")
+            
+            # Store latest command (effort will be managed by GraspManager)
+            self.latest_command = GripperCommand(
+                position_pct=target_position,
+                effort_pct=0.0,  # Effort managed by GraspManager
+                timestamp=time.monotonic(),
+                q_radians=q,
+                tau=motor_cmd.tau
+            )
+        except Exception as e:
+            self.logger.error(f"Command reception error: {e}")
+            import traceback
+            self.logger.error(traceback.format_exc())
     
     def execute_command(self):
         """
@@ -757,14 +802,11 @@ class CorrectedEZGripperDriver:
             # Add commanded position to sensor data for GraspManager
             sensor_data['commanded_position'] = cmd.position_pct
             
-            # Get hardware current limit from config for percentage conversion
-            hardware_current_limit = self.gripper.config._config.get('servo', {}).get('dynamixel_settings', {}).get('current_limit', 1600)
-            
             # Process DDS command as INPUT through GraspManager
             # GraspManager returns the MANAGED goal (not raw DDS command)
             goal_position, goal_effort = self.grasp_manager.process_cycle(
                 sensor_data=sensor_data,
-                hardware_current_limit_ma=hardware_current_limit
+                hardware_current_limit_ma=self.hardware_current_limit
             )
             
             # Execute the MANAGED goal (not raw DDS command)
@@ -943,14 +985,7 @@ class CorrectedEZGripperDriver:
             grasp_state_name = grasp_state_info.get('state', 'UNKNOWN')
             
             # Map grasp state to enum
-            state_map = {
-                'idle': GraspState.IDLE,
-                'moving': GraspState.MOVING,
-                'contact': GraspState.CONTACT,
-                'grasping': GraspState.GRASPING,
-                'error': GraspState.ERROR
-            }
-            grasp_state_enum = state_map.get(grasp_state_name.lower(), GraspState.IDLE)
+            grasp_state_enum = self.GRASP_STATE_BY_NAME.get(grasp_state_name.lower(), GraspState.IDLE)
             
             # Get error description
             error_description = "No error"
@@ -1055,12 +1090,12 @@ class CorrectedEZGripperDriver:
             
             self._telemetry_log_count += 1
             if self._telemetry_log_count % 3 == 0:
-                self.logger.info(f"📡 TELEMETRY: state={telemetry.grasp_state}, "
-                               f"pos={telemetry.actual_position_pct:.1f}% (cmd={telemetry.commanded_position_pct:.1f}%), "
-                               f"effort={telemetry.managed_effort_pct:.0f}%, "
-                               f"contact={telemetry.contact_detected}, "
-                               f"temp={telemetry.temperature_c:.1f}°C, "
-                               f"error={telemetry.hardware_error}")
+                self.logger.info("📡 TELEMETRY: state=%s, pos=%.1f%% (cmd=%.1f%%), "
+                                 "effort=%.0f%%, contact=%s, temp=%.1f°C, error=%s",
+                                 telemetry.grasp_state,
+                                 telemetry.actual_position_pct, telemetry.commanded_position_pct,
+                                 telemetry.managed_effort_pct, telemetry.contact_detected,
+                                 telemetry.temperature_c, telemetry.hardware_error)
             
             # Publish to DDS as JSON string
             if self.telemetry_enabled and self.telemetry_publisher:
@@ -1076,34 +1111,22 @@ class CorrectedEZGripperDriver:
         except Exception as e:
             self.logger.error(f"Telemetry publishing failed: {e}")
     
-    def publish_state(self):
-        """Publish predicted gripper state at 200 Hz (called from state thread)"""
-        current_time = time.time()
+    def publish_state(self, now=None):
+        """Publish predicted gripper state at 200 Hz (called from state thread)
+        
+        Args:
+            now: Tick time from the state loop (time.monotonic() clock)
+        """
+        current_time = now if now is not None else time.monotonic()
         
         # PROTECTION: Don't publish false state when hardware is unhealthy
         if not self.hardware_healthy:
             # Option: Stop publishing entirely (safer - xr_teleoperate knows something's wrong)
             # return
             
-            # Option: Publish explicit error state
+            # Option: Publish explicit error state (constant, built in _setup_dds)
             try:
-                motor_state = MotorState_(
-                    mode=255,                    # Error mode
-                    q=0.0,                       # Safe position
-                    dq=0.0,                      # No velocity
-                    ddq=0.0,                     # No acceleration
-                    tau_est=0.0,                 # No torque
-                    q_raw=0.0,                   # Raw position (float32)
-                    dq_raw=0.0,                  # Raw velocity (float32)
-                    ddq_raw=0.0,                 # Raw acceleration (float32)
-                    temperature=0,               # Error temperature (uint8)
-                    lost=0xFFFFFFFF,             # Error - max lost packets (uint32)
-                    reserve=[0xFFFFFFFF, 0xFFFFFFFF]  # Error flags (array[uint32, 2])
-                )
-                
-                motor_states = MotorStates_()
-                motor_states.states = [motor_state]
-                self.state_publisher.Write(motor_states)
+                self.state_publisher.Write(self._error_states_msg)
                 return
             except Exception as e:
                 self.logger.error(f"Error state publishing failed: {e}")
@@ -1115,8 +1138,10 @@ class CorrectedEZGripperDriver:
                 actual_pos = self.actual_position_pct
                 current_effort = self.current_effort_pct
             
-            # Convert actual position to Dex1 units for publishing
-            current_q = self.ezgripper_to_dex1(actual_pos)
+            # Convert actual position to Dex1 units for publishing - inline
+            # multiply instead of ezgripper_to_dex1(); the DDS contract clamp
+            # below covers the range limits at 200 Hz
+            current_q = actual_pos * self._pct_to_q
             current_tau = current_effort / 10.0
             
             # Get GraspManager state for GUI display
@@ -1124,46 +1149,32 @@ class CorrectedEZGripperDriver:
             grasp_state = grasp_state_info.get('state', 'UNKNOWN')
             
             # Map GraspState to motor mode for GUI visibility
-            state_to_mode = {
-                'idle': 0,
-                'moving': 1, 
-                'contact': 2,
-                'grasping': 3
-            }
-            mode_for_gui = state_to_mode.get(grasp_state, 1)  # Default to MOVING
+            mode_for_gui = self.GUI_MODE_BY_STATE.get(grasp_state, 1)  # Default to MOVING
             
             # Log state mapping for debugging
             if self.state_publish_count % 50 == 0:  # Every 250ms at 200Hz
-                self.logger.info(f"🔄 GUI STATE: {grasp_state} → mode={mode_for_gui}")
+                self.logger.info("🔄 GUI STATE: %s → mode=%d", grasp_state, mode_for_gui)
             
-            self.logger.info(f"📤 PUBLISH: actual_pos={actual_pos:.1f}% → DDS_q={current_q:.3f}rad, state={grasp_state}")
+            self.logger.info("📤 PUBLISH: actual_pos=%.1f%% → DDS_q=%.3frad, state=%s",
+                             actual_pos, current_q, grasp_state)
             
-            # Create motor state with official SDK2 structure
+            # Update the cached motor state (official SDK2 structure) in place.
+            # dq/ddq, their raw variants, lost and reserve stay at zero.
             # ENFORCE DDS CONTRACT: Clamp to valid range [0.0, 5.4] before writing to DDS
             clamped_q = max(0.0, min(5.4, current_q))
-            motor_state = MotorState_(
-                mode=mode_for_gui,                 # GraspManager state for GUI
-                q=clamped_q,                      # Position feedback
-                dq=0.0,                           # No velocity data
-                ddq=0.0,                          # No acceleration data
-                tau_est=current_tau,              # Torque estimation
-
-                q_raw=clamped_q,                  # Raw position (float32)
-                dq_raw=0.0,                       # Raw velocity (float32)
-                ddq_raw=0.0,                      # Raw acceleration (float32)
-                temperature=int(self.get_temperature()),  # Temperature (uint8)
-                lost=0,                           # Lost packets (uint32)
-                reserve=[0, 0]                    # Reserve array[uint32, 2]
-            )
-            
-            # Create MotorStates_ message
-            motor_states = MotorStates_()
-            motor_states.states = [motor_state]
+            motor_state = self._state_msg
+            motor_state.mode = mode_for_gui                         # GraspManager state for GUI
+            motor_state.q = clamped_q                               # Position feedback
+            motor_state.tau_est = current_tau                       # Torque estimation
+            motor_state.q_raw = clamped_q                           # Raw position (float32)
+            motor_state.temperature = int(self.get_temperature())   # Temperature (uint8)
             
             # Publish to DDS
             try:
-                result = self.state_publisher.Write(motor_states)
-                self.logger.debug(f"Write() returned: {result} (type: {type(result)})")
+                result = self.state_publisher.Write(self._states_msg)
+                # 200 Hz path - skip building the debug record unless DEBUG is on
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Write() returned: %s (type: %s)", result, type(result))
             except TypeError as e:
                 if "'tuple' object is not callable" in str(e):
                     # This is a bug in CycloneDDS library - ignore it
@@ -1193,7 +1204,8 @@ class CorrectedEZGripperDriver:
                 
                 position_error = abs(current_actual - current_commanded)
                 
-                self.logger.info(f"📊 Monitor: State={actual_rate:.1f}Hz | Cmd={current_commanded:.1f}% | Actual={current_actual:.1f}% | Err={position_error:.1f}%")
+                self.logger.info("📊 Monitor: State=%.1fHz | Cmd=%.1f%% | Actual=%.1f%% | Err=%.1f%%",
+                                 actual_rate, current_commanded, current_actual, position_error)
                 
                 self.state_publish_count = 0
                 self.last_monitor_time = current_time
@@ -1205,7 +1217,7 @@ class CorrectedEZGripperDriver:
         """Control thread: Receive commands and execute at 30 Hz (limited by serial)"""
         self.logger.info("Starting control thread at 30 Hz...")
         period = 1.0 / self.control_loop_rate
-        next_cycle = time.time()
+        next_cycle = time.monotonic()
         
         try:
             while self.running:
@@ -1228,13 +1240,10 @@ class CorrectedEZGripperDriver:
                             
                             sensor_data['commanded_position'] = commanded_position
                             
-                            # Get hardware current limit from config
-                            hardware_current_limit = self.gripper.config._config.get('servo', {}).get('dynamixel_settings', {}).get('current_limit', 1600)
-                            
                             # GraspManager runs every cycle for autonomous stall detection
                             goal_position, goal_effort = self.grasp_manager.process_cycle(
                                 sensor_data=sensor_data,
-                                hardware_current_limit_ma=hardware_current_limit
+                                hardware_current_limit_ma=self.hardware_current_limit
                             )
                             
                             # Track managed effort for telemetry
@@ -1248,14 +1257,17 @@ class CorrectedEZGripperDriver:
                             time.sleep(0.005)
                             
                             # Log periodically
-                            if self.command_count % 30 == 0:  # Every second at 30Hz
+                            if self.command_count % 30 == 0 and self.logger.isEnabledFor(logging.INFO):  # Every second at 30Hz
                                 state_info = self.grasp_manager.get_state_info()
-                                self.logger.info(f"🎯 AUTONOMOUS: pos={goal_position:.1f}%, effort={goal_effort:.1f}%, state={state_info.get('state', 'UNKNOWN')}")
+                                self.logger.info("🎯 AUTONOMOUS: pos=%.1f%%, effort=%.1f%%, state=%s",
+                                                 goal_position, goal_effort, state_info.get('state', 'UNKNOWN'))
                             
                             self.command_count += 1
                             
-                            current_ma = sensor_data.get('current', 0)
-                            self.logger.info(f"📊 SENSOR: raw={sensor_data.get('position_raw', 'N/A')}, pct={sensor_data.get('position', 'N/A'):.1f}%, current={current_ma}mA")
+                            self.logger.info("📊 SENSOR: raw=%s, pct=%.1f%%, current=%smA",
+                                             sensor_data.get('position_raw', 'N/A'),
+                                             sensor_data.get('position', 0.0),
+                                             sensor_data.get('current', 0))
                             
                             self._handle_servo_errors(self.get_error_details())
                             
@@ -1263,7 +1275,7 @@ class CorrectedEZGripperDriver:
                                 self.actual_position_pct = self.get_position()
                                 self.predicted_position_pct = self.actual_position_pct
                             
-                            self.logger.info(f"🔄 READ: actual_position_pct={self.actual_position_pct:.1f}%")
+                            self.logger.info("🔄 READ: actual_position_pct=%.1f%%", self.actual_position_pct)
                             
                             # Publish telemetry at 30Hz (same as control loop)
                             if self.telemetry_enabled:
@@ -1273,26 +1285,31 @@ class CorrectedEZGripperDriver:
                             self.publish_ezgripper_state()
                             
                             self.comm_error_count = 0
-                            self.last_successful_comm = time.time()
+                            self.last_successful_comm = time.monotonic()
                             self.hardware_healthy = True  # Reset health on successful communication
                         
                     except Exception as e:
                         self._handle_communication_error(e)
-                        # Clear the serial buffer to recover from noise/collisions
-                        if hasattr(self.connection, 'port'):
-                            try:
-                                self.connection.port.reset_input_buffer()
-                                self.logger.debug(f"Serial buffer cleared after error: {e}")
-                            except:
-                                pass
+                        # Clear the serial buffer to recover from noise/collisions.
+                        # The lock only serialises against the locked write and
+                        # single-register paths; the bulk read runs on this thread.
+                        # Any failure here (e.g. termios.error once the adapter is
+                        # unplugged) must not skip the cycle scheduling below.
+                        try:
+                            with self.connection.lock:
+                                self.connection.portHandler.ser.reset_input_buffer()
+                            self.logger.debug(f"Serial buffer cleared after error: {e}")
+                        except Exception as clear_e:
+                            self.logger.warning(f"Failed to clear serial buffer: {clear_e}")
                     
-                    # Absolute time scheduling
+                    # Absolute time scheduling on the monotonic clock
                     next_cycle += period
-                    sleep_time = next_cycle - time.time()
+                    now = time.monotonic()
+                    sleep_time = next_cycle - now
                     if sleep_time > 0:
                         time.sleep(sleep_time)
                     else:
-                        next_cycle = time.time()
+                        next_cycle = now
                         
                 except Exception as iter_e:
                     self.logger.error(f"❌ Control loop iteration crashed: {iter_e}")
@@ -1337,7 +1354,7 @@ class CorrectedEZGripperDriver:
             self.hardware_healthy = False
             return
         
-        if time.time() - self.last_successful_comm > 2.0:  # 2 second timeout
+        if time.monotonic() - self.last_successful_comm > 2.0:  # 2 second timeout
             self.gripper.goto_position(50.0, 10.0)  # Safe position with low effort
             self.hardware_healthy = False
 
@@ -1345,80 +1362,52 @@ class CorrectedEZGripperDriver:
         """State thread: Publish actual position at 200 Hz"""
         self.logger.info("Starting state thread at 200 Hz...")
         period = 1.0 / self.state_loop_rate
-        next_cycle = time.time()
+        now = time.monotonic()
+        next_cycle = now
 
         try:
             while self.running:
                 # Publish actual position from 30Hz control loop
-                self.publish_state()
+                self.publish_state(now)
 
-                # Absolute time scheduling for precise 200 Hz
+                # Absolute time scheduling for precise 200 Hz (monotonic clock,
+                # so wall-clock steps from NTP cannot stall or burst the loop).
+                # The clock is read once per tick; after sleeping, the tick time
+                # is the deadline we slept until.
                 next_cycle += period
-                sleep_time = next_cycle - time.time()
+                now = time.monotonic()
+                sleep_time = next_cycle - now
                 if sleep_time > 0:
                     time.sleep(sleep_time)
+                    now = next_cycle
                 else:
                     # Missed deadline - reset
-                    next_cycle = time.time()
+                    next_cycle = now
 
         except Exception as e:
             self.logger.error(f"State thread error: {e}")
         finally:
             self.logger.info("State thread stopped")
 
-    def ezgripper_admin_reception_loop(self):
-        """Dedicated thread for EZGripper admin command reception"""
-        if not self.ezgripper_interface_enabled or not self.ezgripper_admin_subscriber:
-            self.logger.info("EZGripper admin interface not enabled - skipping admin reception thread")
-            return
-            
-        self.logger.info("Starting EZGripper admin reception thread...")
-        self.logger.info(f"Listening on topic: rt/ezgripper/{self.side}/admin")
-        
-        admin_cmd_count = 0
-        while self.running:
-            try:
-                # ChannelSubscriber.Read() blocks until message arrives
-                msg = self.ezgripper_admin_subscriber.Read()
-                
-                if msg:
-                    admin_cmd_count += 1
-                    self.ezgripper_admin_callback(msg)
-                    
-            except Exception as e:
-                if self.running:  # Only log if not shutting down
-                    self.logger.error(f"EZGripper admin reception error: {e}")
-                    import traceback
-                    self.logger.error(traceback.format_exc())
-                    time.sleep(0.1)  # Brief pause on error
-        
-        self.logger.info(f"EZGripper admin reception thread stopped (received {admin_cmd_count} commands total)")
-
     def start(self):
         """Launch driver threads (non-blocking). Call join() or run() to wait."""
         self.logger.info(f"Starting {self.side} gripper threads...")
-        self.command_thread = threading.Thread(
-            target=self.command_reception_loop, daemon=True,
-            name=f"Cmd-{self.side}")
         self.control_thread = threading.Thread(
             target=self.control_loop, daemon=True,
             name=f"Ctrl-{self.side}")
         self.state_thread = threading.Thread(
             target=self.state_loop, daemon=True,
             name=f"State-{self.side}")
-        self.admin_thread = None
-        if self.ezgripper_interface_enabled:
-            self.admin_thread = threading.Thread(
-                target=self.ezgripper_admin_reception_loop, daemon=True,
-                name=f"Admin-{self.side}")
 
-        self.command_thread.start()
         self.control_thread.start()
         self.state_thread.start()
-        if self.admin_thread:
-            self.admin_thread.start()
+
+        # Commands (and admin messages, see _setup_dds) are delivered by the
+        # DDS listener thread as they arrive - no polling Read() threads
+        self.cmd_subscriber.Init(self.dex1_command_callback)
+        self.logger.info(f"Listening on topic: rt/dex1/{self.side}/cmd")
         self.logger.info(f"  {self.side}: control@30Hz, state@200Hz" +
-                         (", admin" if self.admin_thread else ""))
+                         (", admin" if self.ezgripper_interface_enabled else ""))
 
     def join(self, close_connection: bool = True):
         """Wait for all threads to stop and shut down hardware."""
@@ -1429,13 +1418,11 @@ class CorrectedEZGripperDriver:
             self.logger.info("Shutdown signal received...")
         finally:
             self.running = False
-            for t, timeout in [(self.command_thread, 1.5),
-                                (self.control_thread, 1.5),
-                                (self.state_thread,   1.0),
-                                (self.admin_thread,   1.0)]:
+            for t, timeout in [(self.control_thread, 1.5),
+                                (self.state_thread,   1.0)]:
                 if t and t.is_alive():
                     t.join(timeout=timeout)
-            self.logger.info("Threads joined.")
+            self.logger.info(f"Threads joined (received {self.dds_command_count} commands total).")
             if not close_connection:
                 # Caller manages the shared connection — don't close it
                 self.connection = None
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Device config file access for EZGripper
+
+The device config (/tmp/ezgripper_device_config.json) maps sides to
+devices and serial numbers to calibration offsets. It is written by the
+driver and by calibrate_and_save.py, so every write goes through
+update_device_config(): an exclusive lock around the read-modify-write,
+and an atomic rename so readers never see a partial file.
+"""
+
+import fcntl
+import json
+import os
+import tempfile
+from typing import Any, Callable, Dict
+
+DEVICE_CONFIG_FILE = '/tmp/ezgripper_device_config.json'
+
+
+def update_device_config(update: Callable[[Dict[str, Any]], None],
+                         config_file: str = DEVICE_CONFIG_FILE) -> Dict[str, Any]:
+    """
+    Apply update() to the device config and write it back atomically
+
+    Args:
+        update: Called with the current config dict (empty if the file does
+            not exist yet); modifies it in place
+        config_file: Path to the device config file
+
+    Returns:
+        The config dict as written
+    """
+    # The lock lives on a sidecar file because os.replace() swaps the
+    # config inode underneath any lock taken on the config itself
+    with open(config_file + '.lock', 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+        config = {}
+        try:
+            with open(config_file, 'r') as f:
+                data = f.read()
+            if data:
+                config = json.loads(data)
+            st = os.stat(config_file)
+        except FileNotFoundError:
+            st = None
+
+        update(config)
+
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(config_file),
+                                        prefix='.ezgripper_config_', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as tmp:
+                json.dump(config, tmp, indent=2)
+                tmp.flush()
+                os.fsync(tmp.fileno())
+
+            # mkstemp creates the file 0600 and owned by us - keep the
+            # existing file's mode/owner so other users can still read it
+            if st is not None:
+                os.chmod(tmp_path, st.st_mode & 0o777)
+                try:
+                    os.chown(tmp_path, st.st_uid, st.st_gid)
+                except OSError:
+                    pass  # Only root can give the file away
+            else:
+                os.chmod(tmp_path, 0o644)
+
+            os.replace(tmp_path, config_file)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    return config
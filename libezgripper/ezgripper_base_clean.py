@@ -46,6 +46,7 @@ class Gripper:
     def __init__(self, connection, name, servo_ids, config: Config, collision_reaction: Optional[Any] = None):
         """Initialize gripper with minimal setup"""
         self.name = name
+        self.logger = logging.getLogger(name)  # Shares the driver's named logger
         self.config = config
         self.connection = connection
         self.servo_ids = servo_ids
@@ -63,6 +64,17 @@ class Gripper:
         self._last_position = None
         self.cached_sensor_data = None
         
+        # Scaling constants used by every bulk read/write - resolved once from
+        # config rather than per 30 Hz cycle
+        self.grip_max = self.config._config.get('gripper', {}).get('grip_max', 2500)
+        self.max_current = self.config._config.get('servo', {}).get('dynamixel_settings', {}).get('current_limit', 1600)
+        # Percent -> servo unit factors for bulk_write_control_data
+        self.position_scale = self.grip_max / 100.0
+        self.current_scale = self.max_current / 100.0
+        
+        # Sensor read counter for the once-per-second debug log
+        self._debug_counter = 0
+        
         # Initialize bulk read/write objects
         self._setup_bulk_operations()
         
@@ -161,15 +173,15 @@ class Gripper:
                 print(f"    Updating {setting_name}: {current_value} -> {target_value}")
                 
                 # Disable torque if writing to EEPROM
+                # (status_return_level 2: the write is ACKed once applied,
+                # so no settle delay is needed before the next write)
                 if is_eeprom and torque_status != 0:
                     servo.write_address(64, [0])
                     torque_status = 0
-                    time.sleep(0.05)
                 
                 # Write new value
                 try:
                     servo.write_word(register_addr, target_value)
-                    time.sleep(0.05)
                     
                     # Verify write with correct read method
                     if is_one_byte:
@@ -188,7 +200,6 @@ class Gripper:
             if torque_status != 1:
                 print(f"    Enabling torque for operation...")
                 servo.write_address(64, [1])
-                time.sleep(0.05)
                 print(f"    ✅ Torque enabled")
         
         print("  Setup complete - all settings applied")
@@ -216,12 +227,14 @@ class Gripper:
             dict: Current sensor data, collision status, and reaction result
         """
         try:
+            # Each phase boundary is timestamped once and reused as the start
+            # of the next phase
             loop_start = time.time()
             
             # Step 1: Bulk read all sensor data
-            read_start = time.time()
             sensor_data = self.bulk_read_sensor_data(0)
-            read_time = (time.time() - read_start) * 1000  # ms
+            read_end = time.time()
+            read_time = (read_end - loop_start) * 1000  # ms
             self.cached_sensor_data = sensor_data
             
             # Step 2: Collision detection (if monitoring enabled)
@@ -230,15 +243,14 @@ class Gripper:
             reaction_result = None
             
             if self.collision_monitoring_enabled and self.collision_reaction:
-                detect_start = time.time()
                 collision = self._detect_collision(sensor_data)
-                detect_time = (time.time() - detect_start) * 1000  # ms
+                detect_end = time.time()
+                detect_time = (detect_end - read_end) * 1000  # ms
                 
                 if collision:
-                    handle_start = time.time()
                     # Call pluggable reaction strategy
                     reaction_result = self.collision_reaction.on_collision(self, sensor_data)
-                    handle_time = (time.time() - handle_start) * 1000  # ms
+                    handle_time = (time.time() - detect_end) * 1000  # ms
                     
                     # Check if reaction wants to stop monitoring
                     if reaction_result and reaction_result.get('stop_monitoring', False):
@@ -348,28 +360,30 @@ class Gripper:
         
         try:
             # Execute bulk read - SINGLE USB transaction
-            result = self.bulk_read.txRxPacket()
+            bulk_read = self.bulk_read
+            result = bulk_read.txRxPacket()
             if result != COMM_SUCCESS:
                 raise Exception(f"Bulk read communication failed: {result}")
             
             servo_id = self.servo_ids[servo_num]
             
             # Check if data is available
-            if not self.bulk_read.isAvailable(servo_id, 126, 21):
+            if not bulk_read.isAvailable(servo_id, 126, 21):
                 raise Exception(f"Bulk read data not available for servo {servo_id}")
             
             # Extract data from bulk read buffer (all in one transaction)
+            get_data = bulk_read.getData
             # Register 126: present_current (2 bytes)
-            current_raw = self.bulk_read.getData(servo_id, 126, 2)
+            current_raw = get_data(servo_id, 126, 2)
             
             # Register 132: present_position (4 bytes)
-            position_raw = self.bulk_read.getData(servo_id, 132, 4)
+            position_raw = get_data(servo_id, 132, 4)
             
             # Register 144: present_voltage (2 bytes)
-            voltage_raw = self.bulk_read.getData(servo_id, 144, 2)
+            voltage_raw = get_data(servo_id, 144, 2)
             
             # Register 146: present_temperature (1 byte)
-            temperature = self.bulk_read.getData(servo_id, 146, 1)
+            temperature = get_data(servo_id, 146, 1)
             
             # Parse position with wrap-around handling
             sensor_data['position_raw'] = position_raw
@@ -389,9 +403,7 @@ class Gripper:
                 diff = diff + 4294967296
             
             # Map distance to 0-100% (grip_max units = 100%)
-            # Gripper range from config
-            grip_max = self.config._config.get('gripper', {}).get('grip_max', 2500)
-            position_pct = (diff / float(grip_max)) * 100.0
+            position_pct = (diff / float(self.grip_max)) * 100.0
             
             # Clamp to 0-100%
             sensor_data['position'] = max(0.0, min(100.0, position_pct))
@@ -401,15 +413,14 @@ class Gripper:
             sensor_data['current'] = abs(current_signed) * 3.36  # Convert to mA
             
             # DEBUG: Log sensor data including current
-            import logging
-            logger = logging.getLogger(self.name)
-            if not hasattr(self, '_debug_counter'):
-                self._debug_counter = 0
             self._debug_counter += 1
             
             if self._debug_counter % 30 == 0:  # Log once per second at 30Hz
-                logger.info(f"🔍 POS CALC: raw={position_raw}, closed={closed_pos}, diff={diff}, pct={position_pct:.1f}%, final={sensor_data['position']:.1f}%")
-                logger.info(f"🔍 CURRENT: raw={current_raw}, signed={current_signed}, mA={sensor_data['current']:.1f}, temp={temperature}°C")
+                logger = self.logger
+                logger.info("🔍 POS CALC: raw=%d, closed=%d, diff=%d, pct=%.1f%%, final=%.1f%%",
+                            position_raw, closed_pos, diff, position_pct, sensor_data['position'])
+                logger.info("🔍 CURRENT: raw=%d, signed=%d, mA=%.1f, temp=%d°C",
+                            current_raw, current_signed, sensor_data['current'], temperature)
             
             # Parse temperature
             sensor_data['temperature'] = temperature
@@ -442,16 +453,11 @@ class Gripper:
             internal_position = -50
         
         # Calculate goal values - UNCLAMPED
-        grip_max = self.config._config.get('gripper', {}).get('grip_max', 2500)
-        scaled_position = int(int(internal_position) * grip_max / 100)
+        scaled_position = int(int(internal_position) * self.position_scale)
         # Scale effort to current (mA) for Extended Position Control Mode
-        # Get max current from config
-        max_current = self.config._config.get('servo', {}).get('dynamixel_settings', {}).get('current_limit', 1600)
-        goal_current = int(int(self.target_effort) * max_current / 100)
+        goal_current = int(int(self.target_effort) * self.current_scale)
 
-        import logging
-        logger = logging.getLogger(self.name)
-        from dynamixel_sdk import COMM_SUCCESS
+        logger = self.logger
 
         # Build params outside the lock (pure computation, no bus access)
         writes = []
@@ -465,7 +471,8 @@ class Gripper:
                 (target_raw_pos >> 24) & 0xFF,
             ]
             writes.append((self.servo_ids[i], current_param, pos_param))
-            logger.info(f"✍️ WRITE: pos={self.target_position}%→raw={target_raw_pos}, current={self.target_effort}%→{goal_current}mA")
+            logger.info("✍️ WRITE: pos=%s%%→raw=%d, current=%s%%→%dmA",
+                        self.target_position, target_raw_pos, self.target_effort, goal_current)
 
         # Both bulk writes must be atomic — acquire bus lock for the full sequence
         # Use sequential clear-add-transmit pattern to prevent SDK parameter corruption
@@ -490,7 +497,7 @@ class Gripper:
                 logger.error(f"❌ Bulk write position failed: {result}")
                 raise Exception(f"Bulk write position failed: {result}")
 
-        logger.debug(f"✅ Servo write complete")
+        logger.debug("✅ Servo write complete")
 
     def goto_position(self, position_pct, effort_pct):
         """
@@ -504,9 +511,7 @@ class Gripper:
         self.target_effort = effort_pct
         
         # Log to driver logger
-        import logging
-        logger = logging.getLogger(self.name)
-        logger.info(f"🎯 GOTO: position={position_pct}%, effort={effort_pct}%")
+        self.logger.info("🎯 GOTO: position=%s%%, effort=%s%%", position_pct, effort_pct)
         
         # Actually write to servo
         self.bulk_write_control_data()
@@ -531,15 +536,12 @@ class Gripper:
         servo_id = self.servo_ids[0]
         
         # Safe closing force (30% current)
-        max_current = self.config._config.get('servo', {}).get('dynamixel_settings', {}).get('current_limit', 1600)
-        closing_current = int(max_current * 0.3)  # 30% of max current
+        closing_current = int(self.max_current * 0.3)  # 30% of max current
         current_threshold_ma = 400
         
         # Read current position
         pos_bytes = self.servos[0].read_address(132, 4)
-        current_pos = pos_bytes[0] + (pos_bytes[1] << 8) + (pos_bytes[2] << 16) + (pos_bytes[3] << 24)
-        if current_pos & 0x80000000:
-            current_pos = current_pos - 0x100000000
+        current_pos = int.from_bytes(bytes(pos_bytes), 'little', signed=True)
         
         target_pos = current_pos - 15000  # Beyond closed
         
@@ -598,12 +600,10 @@ class Gripper:
                             # Move to stable 50% position with torque enabled
                             # This prevents spring force from opening gripper uncontrollably
                             print(f"  🎯 Moving to 50% position...")
-                            grip_max = self.config._config.get('gripper', {}).get('grip_max', 2500)
-                            target_50pct = self.zero_positions[0] + int(grip_max * 0.5)  # 50% of range
+                            target_50pct = self.zero_positions[0] + int(self.grip_max * 0.5)  # 50% of range
                             
                             # Write position with moderate current
-                            max_current = self.config._config.get('servo', {}).get('dynamixel_settings', {}).get('current_limit', 1600)
-                            moderate_current = int(max_current * 0.4)  # 40% current for stable hold
+                            moderate_current = int(self.max_current * 0.4)  # 40% current for stable hold
                             self.bulk_write_current.clearParam()
                             current_param = [moderate_current & 0xFF, (moderate_current >> 8) & 0xFF]
                             self.bulk_write_current.addParam(servo_id, current_param)
@@ -619,8 +619,9 @@ class Gripper:
                             self.bulk_write_position.addParam(servo_id, pos_param)
                             self.bulk_write_position.txPacket()
                             
-                            # Wait for movement to complete
-                            time.sleep(1.0)
+                            # Wait for movement to complete (within 1.5% of range)
+                            if self.wait_until_settled(target_50pct, int(self.grip_max * 0.015)) is None:
+                                print(f"  ⚠️  50% position not reached within 3.0s")
                             
                             print(f"  ✅ Calibration complete - gripper at 50% with torque enabled")
                             return True
@@ -637,6 +638,29 @@ class Gripper:
         self.bulk_write_current.txPacket()
         return False
 
+    def wait_until_settled(self, target_raw, tolerance, timeout=3.0, sample_dt=0.033):
+        """Poll Present Position until it stays within tolerance of target_raw
+        
+        Returns the elapsed time in seconds once two consecutive samples are
+        within tolerance, or None if timeout expires first.
+        """
+        servo_id = self.servo_ids[0]
+        start = time.monotonic()
+        deadline = start + timeout
+        in_band = 0
+        while time.monotonic() < deadline:
+            time.sleep(sample_dt)
+            if self.bulk_read.txRxPacket() != COMM_SUCCESS:
+                continue
+            position_raw = self.bulk_read.getData(servo_id, 132, 4)
+            if abs(position_raw - target_raw) <= tolerance:
+                in_band += 1
+                if in_band >= 2:
+                    return time.monotonic() - start
+            else:
+                in_band = 0
+        return None
+
     def get_position(self):
         """Get current position in percent (for DDS interface) - uses cached data"""
         if self.cached_sensor_data:
@@ -21,6 +21,29 @@ class GripperTelemetry:
     Provides algorithmic state and health metrics for monitoring and learning.
     """
     
+    # Fixed field set - __slots__ drops the per-instance __dict__ for this
+    # 30 Hz message. Keep in sync with the fields below.
+    __slots__ = (
+        'timestamp',
+        'commanded_position_pct',
+        'actual_position_pct',
+        'position_error_pct',
+        'grasp_state',
+        'managed_effort_pct',
+        'commanded_effort_pct',
+        'contact_detected',
+        'contact_sample_count',
+        'current_threshold_exceeded',
+        'position_stagnant',
+        'temperature_c',
+        'current_ma',
+        'voltage_v',
+        'is_moving',
+        'temperature_trend',
+        'hardware_error',
+        'hardware_error_description',
+    )
+    
     # Timestamp
     timestamp: float
     
@@ -95,8 +118,13 @@ class GripperTelemetry:
         """
         import time
         
+        # Bind driver state once - the control/command threads may swap these
+        # references mid-call, and each attribute/dict hop costs at 30 Hz
+        latest_command = driver.latest_command
+        sensor_data = driver.current_sensor_data
+        
         # Get position data
-        commanded_pos = driver.latest_command.position_pct if driver.latest_command else 0.0
+        commanded_pos = latest_command.position_pct if latest_command else 0.0
         actual_pos = driver.actual_position_pct
         position_error = commanded_pos - actual_pos
         
@@ -105,7 +133,7 @@ class GripperTelemetry:
         
         # Get effort data
         managed_effort = driver.managed_effort if hasattr(driver, 'managed_effort') else 0.0
-        commanded_effort = driver.latest_command.effort_pct if driver.latest_command else 0.0
+        commanded_effort = latest_command.effort_pct if latest_command else 0.0
         
         # Get contact detection state
         gm = driver.grasp_manager
@@ -119,10 +147,7 @@ class GripperTelemetry:
             contact_detected = contact_sample_count >= gm.CONSECUTIVE_SAMPLES_REQUIRED
             
             # Check current threshold (need sensor data)
-            if driver.current_sensor_data:
-                current_ma = abs(driver.current_sensor_data.get('current', 0))
-                max_current = driver.gripper.config._config.get('servo', {}).get('dynamixel_settings', {}).get('current_limit', 1600)
-                current_pct = (current_ma / float(max_current)) * 100.0
+            if sensor_data:
                 # Note: Current threshold detection removed - not used in stall-based detection
                 current_threshold_exceeded = False
                 
@@ -139,11 +164,11 @@ class GripperTelemetry:
         is_moving = False
         temperature_trend = "unknown"
         
-        if driver.current_sensor_data:
-            temperature_c = driver.current_sensor_data.get('temperature', -1.0)
-            current_ma = abs(driver.current_sensor_data.get('current', 0.0))
-            voltage_v = driver.current_sensor_data.get('voltage', 0.0)
-            is_moving = driver.current_sensor_data.get('is_moving', False)
+        if sensor_data:
+            temperature_c = sensor_data.get('temperature', -1.0)
+            current_ma = abs(sensor_data.get('current', 0.0))
+            voltage_v = sensor_data.get('voltage', 0.0)
+            is_moving = sensor_data.get('is_moving', False)
         
         if hasattr(driver, 'health_monitor'):
             temperature_trend = driver.health_monitor.get_temperature_trend()
@@ -152,8 +177,8 @@ class GripperTelemetry:
         hardware_error = 0
         hardware_error_description = "No error"
         
-        if driver.current_sensor_data:
-            hardware_error = driver.current_sensor_data.get('error', 0)
+        if sensor_data:
+            hardware_error = sensor_data.get('error', 0)
             if hardware_error != 0:
                 # Decode Dynamixel error bits
                 errors = []
@@ -53,11 +53,7 @@ class HealthMonitor:
         try:
             # Current is 2 bytes, signed
             data = self.servo.read_address(self.config.reg_present_current, 2)
-            current_raw = data[0] + (data[1] << 8)
-            
-            # Handle signed 16-bit
-            if current_raw >= 32768:
-                current_raw -= 65536
+            current_raw = int.from_bytes(bytes(data), 'little', signed=True)
             
             # Convert to mA (unit is 1 mA for MX-64)
             return float(current_raw)
@@ -69,7 +65,7 @@ class HealthMonitor:
         try:
             # Voltage is 2 bytes
             data = self.servo.read_address(self.config.reg_present_voltage, 2)
-            voltage_raw = data[0] + (data[1] << 8)
+            voltage_raw = int.from_bytes(bytes(data), 'little')
             
             # Convert to volts (unit is 0.1V)
             return voltage_raw * 0.1
@@ -87,11 +83,7 @@ class HealthMonitor:
         """Read goal position"""
         try:
             data = self.servo.read_address(self.config.reg_goal_position, 4)
-            position = data[0] + (data[1] << 8) + (data[2] << 16) + (data[3] << 24)
-            
-            # Handle signed 32-bit
-            if position >= 2147483648:
-                position -= 4294967296
+            position = int.from_bytes(bytes(data), 'little', signed=True)
             
             return position
         except Exception as e:
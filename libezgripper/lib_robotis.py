@@ -6,6 +6,7 @@ This provides the same interface as lib_robotis.py but uses the official
 Dynamixel SDK for Protocol 2.0 communication instead of custom implementation.
 """
 
+import os
 import time
 import threading
 from dynamixel_sdk import *
@@ -36,7 +37,33 @@ class USB2Dynamixel_Device:
         if not self.portHandler.setBaudRate(baudrate):
             raise CommunicationError(f"Failed to set baudrate to {baudrate}")
         
+        # setBaudRate() re-creates the serial object, so tune it afterwards
+        self._enable_low_latency()
+        
         time.sleep(0.1)  # Stabilization delay
+    
+    def _enable_low_latency(self):
+        """Drop the USB-serial latency timer to 1 ms (Linux) - best effort
+        
+        USB-serial adapters otherwise hold short status packets for the
+        driver's latency timer (16 ms on FTDI) before handing them over.
+        FTDI adapters expose the timer in sysfs; other tty drivers may
+        still honour ASYNC_LOW_LATENCY via TIOCSSERIAL.
+        """
+        tty = os.path.basename(os.path.realpath(self.dev_name))
+        latency_path = f"/sys/bus/usb-serial/devices/{tty}/latency_timer"
+        try:
+            with open(latency_path, 'w') as f:
+                f.write('1')
+            return
+        except OSError:
+            pass  # Not FTDI, not Linux, or no write permission - try the ioctl
+        
+        try:
+            self.portHandler.ser.set_low_latency_mode(True)
+        except (AttributeError, OSError, ValueError) as e:
+            # Non-Linux host, old pyserial, or tty driver without TIOCSSERIAL
+            print(f"Note: could not enable low-latency mode on {self.dev_name}: {e}")
 
 class Robotis_Servo:
     """Robotis servo control using Dynamixel SDK backend"""
@@ -105,6 +132,21 @@ class Robotis_Servo:
             else:
                 raise ValueError(f"Unsupported read size: {nBytes}")
     
+    def read_block(self, address, length):
+        """Read length contiguous bytes starting at address in one READ_DATA
+        transaction (one round trip instead of one per register)"""
+        with self.dyn.lock:
+            data, comm_result, error = self.dyn.packetHandler.readTxRx(
+                self.dyn.portHandler, self.servo_id, address, length
+            )
+            if comm_result != COMM_SUCCESS:
+                raise CommunicationError(
+                    self.dyn.packetHandler.getTxRxResult(comm_result)
+                )
+            if error != 0:
+                raise ErrorResponse(error)
+            return bytes(data)
+    
     def write_address(self, address, data):
         """Write data at the address"""
         with self.dyn.lock:
@@ -115,12 +157,12 @@ class Robotis_Servo:
                     self.dyn.portHandler, self.servo_id, address, data[0]
                 )
             elif nBytes == 2:
-                value = data[0] + (data[1] << 8)
+                value = int.from_bytes(bytes(data), 'little')
                 comm_result, error = self.dyn.packetHandler.write2ByteTxRx(
                     self.dyn.portHandler, self.servo_id, address, value
                 )
             elif nBytes == 4:
-                value = data[0] + (data[1] << 8) + (data[2] << 16) + (data[3] << 24)
+                value = int.from_bytes(bytes(data), 'little')
                 comm_result, error = self.dyn.packetHandler.write4ByteTxRx(
                     self.dyn.portHandler, self.servo_id, address, value
                 )
@@ -154,7 +196,7 @@ class Robotis_Servo:
     def read_word(self, addr):
         """Read 2-byte word from address"""
         data = self.read_address(addr, 2)
-        return data[0] + (data[1] << 8)
+        return int.from_bytes(bytes(data), 'little')
     
     def write_word(self, addr, word):
         """Write word to address with correct byte size for MX-64 Protocol 2.0"""
@@ -225,28 +267,18 @@ class Robotis_Servo:
     def read_encoder(self):
         """Read current encoder position (Present Position register 132)"""
         data = self.read_address(132, 4)
-        position = data[0] + (data[1] << 8) + (data[2] << 16) + (data[3] << 24)
-        # Handle signed 32-bit integer
-        if position >= 2147483648:
-            position -= 4294967296
-        return position
+        # Present Position is a signed 32-bit integer
+        return int.from_bytes(bytes(data), 'little', signed=True)
     
     def read_word_signed(self, addr):
         """Read signed word from address (handles 4-byte registers as signed)"""
         # For Protocol 2.0, position registers are 4 bytes
         if addr >= 100:
             data = self.read_address(addr, 4)
-            value = data[0] + (data[1] << 8) + (data[2] << 16) + (data[3] << 24)
-            # Handle signed 32-bit integer
-            if value >= 2147483648:
-                value -= 4294967296
         else:
             data = self.read_address(addr, 2)
-            value = data[0] + (data[1] << 8)
-            # Handle signed 16-bit integer
-            if value >= 32768:
-                value -= 65536
-        return value
+        # Decode as signed little-endian (32-bit or 16-bit)
+        return int.from_bytes(bytes(data), 'little', signed=True)
 
 def create_connection(dev_name, baudrate=1000000):
     """Create USB2Dynamixel connection"""
@@ -262,14 +294,23 @@ def find_servos_on_all_ports(baudrate=1000000):
     for port in ports:
         try:
             dyn = USB2Dynamixel_Device(port.device, baudrate)
+        except (CommunicationError, OSError):
+            # Port busy, not a serial device we can open, or wrong baud rate
+            continue
+        
+        try:
             # Try to ping servo IDs 1-10
             for servo_id in range(1, 11):
                 try:
-                    servo = Robotis_Servo(dyn, servo_id)
-                    servos.append((port.device, servo_id))
-                except:
-                    pass
-        except:
+                    Robotis_Servo(dyn, servo_id)
+                except CommunicationError:
+                    # No servo with this ID
+                    continue
+                servos.append((port.device, servo_id))
+        except OSError:
+            # Device went away mid-scan - skip the rest of this port
             pass
+        finally:
+            dyn.portHandler.closePort()
     
     return servos
@@ -54,7 +54,7 @@ def smart_init_servo(servo, config) -> Dict[str, Tuple[int, int, bool]]:
                 current_value = servo.read_address(register_addr)[0]
             elif num_bytes == 2:
                 data = servo.read_address(register_addr, 2)
-                current_value = data[0] + (data[1] << 8)
+                current_value = int.from_bytes(bytes(data), 'little')
             else:
                 logger.warning(f"Unsupported byte count {num_bytes} for {setting_name}")
                 continue
@@ -6,10 +6,8 @@ Only logs when values actually change to avoid spam
 
 import argparse
 import json
-import time
 import signal
-from unitree_sdk2py.core.channel import ChannelFactoryInitialize, ChannelSubscriber
-from unitree_sdk2py.idl.std_msgs.msg.dds_ import String_
+import threading
 
 
 class DebugTelemetryLogger:
@@ -64,50 +62,51 @@ def main():
     parser.add_argument('side', type=str, choices=['left', 'right'], help='Gripper side to monitor')
     args = parser.parse_args()
 
+    from unitree_sdk2py.core.channel import ChannelFactoryInitialize, ChannelSubscriber
+    from unitree_sdk2py.idl.std_msgs.msg.dds_ import String_
+
     # Initialize DDS
     ChannelFactoryInitialize(0)
     
     logger = DebugTelemetryLogger()
     
     topic = f"rt/gripper/debug/{args.side}"
+    stop_event = threading.Event()
+
+    def on_debug(msg):
+        """Handle a debug sample on the DDS listener thread."""
+        if stop_event.is_set():
+            return
+        try:
+            data = json.loads(msg.data)
+
+            # Only log if something changed
+            if logger.should_log(data):
+                print(logger.format_message(data))
+        except Exception as e:
+            print(f"Error: {e}")
+
+    # on_debug fires per sample and prints whatever passes the change filter
     subscriber = ChannelSubscriber(topic, String_)
-    subscriber.Init()
+    subscriber.Init(on_debug)
 
     print(f"Subscribing to {topic}...")
     print("Logging changes only (filtered). Press Ctrl+C to stop.\n")
 
-    running = True
-
     def signal_handler(sig, frame):
-        nonlocal running
         print("\nShutdown signal received...")
-        running = False
+        stop_event.set()
 
     signal.signal(signal.SIGINT, signal_handler)
 
     try:
-        while running:
-            try:
-                msg = subscriber.Read()
-                
-                if msg and hasattr(msg, 'data'):
-                    data = json.loads(msg.data)
-                    
-                    # Only log if something changed
-                    if logger.should_log(data):
-                        print(logger.format_message(data))
-                else:
-                    time.sleep(0.01)
-                    
-            except Exception as e:
-                if running:
-                    print(f"Error: {e}")
-                    time.sleep(0.1)
-
+        while not stop_event.is_set():
+            stop_event.wait(1.0)
     except KeyboardInterrupt:
         print("\nStopping logger...")
     finally:
-        running = False
+        stop_event.set()
+        subscriber.Close()
         print("Logger stopped.")
 
 
@@ -2,11 +2,10 @@ import argparse
 import csv
 import json
 import os
-import time
+import signal
+import threading
 from datetime import datetime
 
-from unitree_sdk2py.core.channel import ChannelFactoryInitialize, ChannelSubscriber
-from unitree_sdk2py.idl.std_msgs.msg.dds_ import String_
 
 class TelemetryCsvLogger:
     """
@@ -56,59 +55,58 @@ def main():
     parser.add_argument('side', type=str, choices=['left', 'right'], help='Gripper side to monitor.')
     args = parser.parse_args()
 
+    from unitree_sdk2py.core.channel import ChannelFactoryInitialize, ChannelSubscriber
+    from unitree_sdk2py.idl.std_msgs.msg.dds_ import String_
+
     # Initialize the DDS channel factory (domain 0, no network interface needed for local)
     ChannelFactoryInitialize(0)
     
     logger = TelemetryCsvLogger()
     
     topic = f"rt/gripper/{args.side}/telemetry"
+    stop_event = threading.Event()
+    last = {'state': None, 'error': "No error"}
+
+    def on_telemetry(msg):
+        """Handle a telemetry sample on the DDS listener thread."""
+        if stop_event.is_set():
+            return
+        try:
+            data = json.loads(msg.data)
+
+            current_state = data['grasp_manager']['state']
+            current_error = data['health']['hardware_error_description']
+
+            # Log only when state or error changes
+            if current_state != last['state'] or current_error != last['error']:
+                print(f"Event: State -> {current_state}, Error -> {current_error}")
+                logger.write_event(data)
+                last['state'] = current_state
+                last['error'] = current_error
+        except Exception as e:
+            print(f"Error handling message: {e}")
+
+    # Event-driven: on_telemetry fires per sample, CSV rows only on changes
     subscriber = ChannelSubscriber(topic, String_)
-    subscriber.Init()
+    subscriber.Init(on_telemetry)
 
     print(f"Subscribing to {topic}...")
     print("Logging significant events. Press Ctrl+C to stop.")
 
-    last_state = None
-    last_error = "No error"
-    running = True
-
     def signal_handler(sig, frame):
-        nonlocal running
         print("\nShutdown signal received...")
-        running = False
+        stop_event.set()
 
-    import signal
     signal.signal(signal.SIGINT, signal_handler)
 
     try:
-        while running:
-            try:
-                # Read message (blocking with timeout)
-                msg = subscriber.Read()
-                
-                if msg and hasattr(msg, 'data'):
-                    data = json.loads(msg.data)
-                    
-                    current_state = data['grasp_manager']['state']
-                    current_error = data['health']['hardware_error_description']
-
-                    # Log only when state or error changes
-                    if current_state != last_state or current_error != last_error:
-                        print(f"Event: State -> {current_state}, Error -> {current_error}")
-                        logger.write_event(data)
-                        last_state = current_state
-                        last_error = current_error
-                else:
-                    time.sleep(0.01)  # Small delay if no message
-            except Exception as e:
-                if running:  # Only log if not shutting down
-                    print(f"Error reading message: {e}")
-                    time.sleep(0.1)
-
+        while not stop_event.is_set():
+            stop_event.wait(1.0)
     except KeyboardInterrupt:
         print("\nStopping logger...")
     finally:
-        running = False
+        stop_event.set()
+        subscriber.Close()
         logger.close()
         print("Logger stopped.")
 
@@ -129,10 +129,8 @@ def main():
     log.info("Joining driver threads...")
     for d in drivers:
         for t, timeout in [
-            (d.command_thread, 1.5),
             (d.control_thread, 1.5),
             (d.state_thread,   1.0),
-            (d.admin_thread,   1.0),
         ]:
             if t and t.is_alive():
                 t.join(timeout=timeout)